@@ -3,7 +3,6 @@ import inspect
 import sys
 from typing import Optional
 
-import pkg_resources
 import shtab
 
 from opera_tosca_parser import commands
@@ -44,6 +43,9 @@ class PrintCurrentVersionAction(argparse.Action):
         :param values: List of values
         :param option_string: Option string
         """
+        # pkg_resources is slow to import, so we import it only when it is needed
+        import pkg_resources  # pylint: disable=import-outside-toplevel
+
         try:
             print(pkg_resources.get_distribution("opera-tosca-parser").version)
             parser.exit(0)
@@ -1,16 +1,18 @@
+from __future__ import annotations
+
 import argparse
+import os
+import stat
 from pathlib import Path, PurePath
-from tempfile import TemporaryDirectory
-from typing import Tuple, Optional
-from zipfile import is_zipfile
+from typing import TYPE_CHECKING, Tuple, Optional
 
 import shtab
-import yaml
 
 from opera_tosca_parser.error import ParseError
-from opera_tosca_parser.parser import tosca
-from opera_tosca_parser.parser.tosca.v_1_3.csar import DirCloudServiceArchive
-from opera_tosca_parser.parser.tosca.v_1_3.template.topology import Topology
+
+# TOSCA parser and YAML modules are imported when they are needed to keep CLI startup (e.g., --help) fast
+if TYPE_CHECKING:
+    from opera_tosca_parser.parser.tosca.v_1_3.template.topology import Topology
 
 
 def add_parser(subparsers: argparse._SubParsersAction):
@@ -39,8 +41,12 @@ def _parser_callback(args: argparse.Namespace) -> int:
     :param args: Supplied arguments
     :return: Exit code - 0 if parsing successful or 1 if not
     """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    from opera_tosca_parser.parser.yaml import SafeLoader  # pylint: disable=import-outside-toplevel
+
     try:
-        inputs = yaml.safe_load(args.inputs) if args.inputs else {}
+        inputs = yaml.load(args.inputs, Loader=SafeLoader) if args.inputs else {}
     except yaml.YAMLError as e:
         print(f"Invalid inputs: {e}")
         return 1
@@ -71,19 +77,48 @@ def parse(csar_or_st_path: PurePath, inputs: Optional[dict]) -> Tuple[Topology,
     :param inputs: TOSCA inputs
     :return: Tuple with Topology object representing TOSCA CSAR entrypoint or service template and working directory
     """
-    if is_zipfile(csar_or_st_path) or Path(csar_or_st_path).is_dir():
+    if _is_csar(csar_or_st_path):
         return parse_csar(csar_or_st_path, inputs)
     else:
         return parse_service_template(csar_or_st_path, inputs)
 
 
+def _is_csar(csar_or_st_path: PurePath) -> bool:
+    """
+    Check whether path points to uncompressed (directory) or compressed (zip) TOSCA CSAR
+    :param csar_or_st_path: Path to TOSCA CSAR or service template
+    :return: True if path points to TOSCA CSAR else False
+    """
+    try:
+        mode = os.stat(csar_or_st_path).st_mode
+        if stat.S_ISDIR(mode):
+            return True
+        if not stat.S_ISREG(mode):
+            return False
+        # check the zip local file header signature instead of searching for zip central directory at the end of file
+        with open(csar_or_st_path, "rb") as fd:
+            return fd.read(4) == b"PK\x03\x04"
+    except OSError:
+        # let the service template parser report missing or unreadable files
+        return False
+
+
 def parse_csar(csar_path: PurePath, inputs: Optional[dict]) -> Tuple[Topology, Path]:
     """
     Parse TOSCA CSAR
     :param csar_path: Path to TOSCA CSAR
     :param inputs: TOSCA inputs
-    :return: Tuple with Topology object representing TOSCA CSAR entrypoint and working directory
+    :return: Tuple with Topology object representing TOSCA CSAR entrypoint and working directory (or path to TOSCA
+             CSAR, when it is compressed)
     """
+    # pylint: disable=import-outside-toplevel
+    from tempfile import TemporaryDirectory
+
+    from opera_tosca_parser.parser import tosca
+    from opera_tosca_parser.parser.tosca.v_1_3.csar import DirCloudServiceArchive, FileCloudServiceArchive
+    from opera_tosca_parser.parser.tosca.v_2_0.csar import FileCloudServiceArchive as FileCloudServiceArchive_2_0
+    from opera_tosca_parser.parser.utils.archive_path import ZipArchivePath
+
     if inputs is None:
         inputs = {}
 
@@ -95,6 +130,10 @@ def parse_csar(csar_path: PurePath, inputs: Optional[dict]) -> Tuple[Topology, P
             workdir = Path(csar_path)
             ast = tosca.load_service_template(workdir, entrypoint)
             return ast.get_template(inputs), workdir
+        elif isinstance(csar, (FileCloudServiceArchive, FileCloudServiceArchive_2_0)):
+            # read TOSCA templates directly from the compressed CSAR instead of extracting the whole archive
+            ast = tosca.load_service_template(ZipArchivePath(csar.backing_zip), entrypoint)
+            return ast.get_template(inputs), Path(csar_path)
         else:
             with TemporaryDirectory() as csar_validation_dir:
                 csar.unpackage_csar(csar_validation_dir)
@@ -110,6 +149,8 @@ def parse_service_template(service_template_path: PurePath, inputs: Optional[dic
     :param inputs: TOSCA inputs
     :return: Tuple with Topology object representing TOSCA service template and working directory
     """
+    from opera_tosca_parser.parser import tosca  # pylint: disable=import-outside-toplevel
+
     if inputs is None:
         inputs = {}
 
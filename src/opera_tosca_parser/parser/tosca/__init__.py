@@ -1,6 +1,7 @@
 import importlib
+from collections import OrderedDict
 from pathlib import PurePath, Path
-from typing import Union
+from typing import Union, Dict, Iterable, Optional, Set, Tuple
 
 from opera_tosca_parser.error import ParseError
 from opera_tosca_parser.parser import yaml
@@ -11,6 +12,7 @@ from opera_tosca_parser.parser.tosca.v_2_0 import Parser
 from opera_tosca_parser.parser.tosca.v_2_0 import ServiceTemplate
 from opera_tosca_parser.parser.tosca.v_2_0 import profiles
 from opera_tosca_parser.parser.tosca.v_2_0.csar import CloudServiceArchive as CloudServiceArchive_2_0
+from opera_tosca_parser.parser.utils.archive_path import ZipArchivePath
 from opera_tosca_parser.parser.utils.location import Location
 from opera_tosca_parser.parser.yaml.node import Node
 
@@ -21,6 +23,11 @@ SUPPORTED_TOSCA_VERSIONS = dict(
     tosca_2_0="v_2_0"
 )
 
+# This is a LRU cache of loaded TOSCA service templates with (absolute base path, service template path) as key and
+# tuple of template file stamps (from entrypoint and all imported templates) and loaded service template as value
+SERVICE_TEMPLATE_CACHE_SIZE = 128
+_service_template_cache: "OrderedDict[Tuple[str, str], Tuple[Dict, ServiceTemplate]]" = OrderedDict()
+
 
 def _get_tosca_version(input_yaml: Node) -> str:
     """
@@ -49,13 +56,61 @@ def _get_parser(tosca_version: str) -> Parser:
     return importlib.import_module(f".{tosca_version}", __name__).Parser  # type: ignore
 
 
-def load_service_template(base_path: Path, service_template_path: PurePath) -> ServiceTemplate:
+def _stat_template_files(base_path: Path,
+                         template_paths: Iterable[PurePath]) -> Dict[PurePath, Optional[Tuple[int, int]]]:
     """
-    Load TOSCA service template
+    Get stamps (modification time and size) for TOSCA service template files
     :param base_path: Base path to workdir where TOSCA service template is located
+    :param template_paths: Paths to TOSCA service template files
+    :return: Dict with template path as key and tuple with modification time and size (or None) as value
+    """
+    stamps: Dict[PurePath, Optional[Tuple[int, int]]] = {}
+    for template_path in template_paths:
+        try:
+            stat_result = (base_path / template_path).stat()
+            stamps[template_path] = (stat_result.st_mtime_ns, stat_result.st_size)
+        except OSError:
+            # templates that are not loaded from workdir (e.g., TOSCA stdlib and profiles) do not change
+            stamps[template_path] = None
+    return stamps
+
+
+def load_service_template(base_path: Union[Path, ZipArchivePath], service_template_path: PurePath) -> ServiceTemplate:
+    """
+    Load TOSCA service template (service templates from workdir are cached until one of their template files changes)
+    :param base_path: Base path to workdir (or compressed TOSCA CSAR) where TOSCA service template is located
     :param service_template_path: Path to TOSCA service template
     :return: Loaded TOSCA service template as dictionary
     """
+    if not isinstance(base_path, Path):
+        return _load_service_template(base_path, service_template_path)[0]
+
+    key = (str(base_path.resolve()), str(service_template_path))
+    cached = _service_template_cache.get(key)
+    if cached is not None and cached[0] == _stat_template_files(base_path, cached[0]):
+        _service_template_cache.move_to_end(key)
+        service = cached[1]
+        # template files did not change, but we still need to check that files referenced from them exist
+        service.visit("resolve_path", base_path)
+        return service
+
+    service, template_paths = _load_service_template(base_path, service_template_path)
+    _service_template_cache[key] = (_stat_template_files(base_path, template_paths), service)
+    _service_template_cache.move_to_end(key)
+    if len(_service_template_cache) > SERVICE_TEMPLATE_CACHE_SIZE:
+        _service_template_cache.popitem(last=False)
+
+    return service
+
+
+def _load_service_template(base_path: Union[Path, ZipArchivePath],
+                           service_template_path: PurePath) -> Tuple[ServiceTemplate, Set[PurePath]]:
+    """
+    Load TOSCA service template without caching
+    :param base_path: Base path to workdir (or compressed TOSCA CSAR) where TOSCA service template is located
+    :param service_template_path: Path to TOSCA service template
+    :return: Tuple with loaded TOSCA service template and paths to all parsed template files
+    """
     with (base_path / service_template_path).open() as input_fd:
         input_yaml = yaml.load(input_fd, str(service_template_path))
     if not isinstance(input_yaml.value, dict):
@@ -65,16 +120,19 @@ def load_service_template(base_path: Path, service_template_path: PurePath) -> S
     parser = _get_parser(tosca_version)
 
     if tosca_version == "v_2_0":
-        service = parser.parse_service_template(input_yaml, base_path, service_template_path, set())[0]
+        service, template_paths = parser.parse_service_template(input_yaml, base_path, service_template_path, set())
     else:
         stdlib_yaml = stdlib.load(tosca_version)
         service = parser.parse_service_template(stdlib_yaml, base_path, PurePath("STDLIB"), set())[0]
-        service.merge(parser.parse_service_template(input_yaml, base_path, service_template_path, set())[0])
+        input_service, template_paths = parser.parse_service_template(
+            input_yaml, base_path, service_template_path, set()
+        )
+        service.merge(input_service)
 
     service.visit("resolve_path", base_path)
     service.visit("resolve_reference", service)
 
-    return service
+    return service, template_paths
 
 
 def load_csar(csar_path: PurePath, validate: bool = True) -> Union[CloudServiceArchive, CloudServiceArchive_2_0]:
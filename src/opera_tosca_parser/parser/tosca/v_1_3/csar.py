@@ -8,9 +8,8 @@ from tempfile import TemporaryDirectory
 from typing import List, IO, Optional
 from zipfile import ZipFile
 
-import yaml
-
 from opera_tosca_parser.error import ParseError
+from opera_tosca_parser.parser import yaml
 from opera_tosca_parser.parser.utils.helper_functions import determine_archive_format
 from opera_tosca_parser.parser.utils.location import Location
 
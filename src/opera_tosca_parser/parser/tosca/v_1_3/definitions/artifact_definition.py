@@ -1,7 +1,6 @@
 from typing import Optional, Dict, Any
 
-import yaml
-
+from opera_tosca_parser.parser import yaml
 from opera_tosca_parser.parser.tosca.v_1_3.value import Value
 from opera_tosca_parser.parser.yaml.node import Node
 from ..entity import Entity
@@ -39,7 +39,7 @@ class ListWrapper(Base):
         Visit ListWrapper object
         :param method: Method
         """
-        for v in self:
+        for v in self.data:
             v.visit(method, *args, **kwargs)
 
 
@@ -83,7 +83,7 @@ class MapWrapper(Base):
         Visit MapWrapper object
         :param method: Method
         """
-        for v in self.values():
+        for v in self.data.values():
             v.visit(method, *args, **kwargs)
 
 
@@ -1,8 +1,12 @@
+import functools
+
 import pkg_resources
 
 from opera_tosca_parser.parser import yaml
 
 
+# parsed YAML nodes are never modified, so TOSCA standard library is read and parsed only once per version
+@functools.lru_cache(maxsize=8)
 def load(version: str) -> yaml.node.Node:
     """
     Load TOSCA version
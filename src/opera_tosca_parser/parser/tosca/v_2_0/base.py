@@ -73,5 +73,6 @@ class Base:
         Visit Base object
         :param method: Method
         """
-        if hasattr(self, method):
-            getattr(self, method)(*args, **kwargs)
+        visitor = getattr(self, method, None)
+        if visitor is not None:
+            visitor(*args, **kwargs)
@@ -33,15 +33,19 @@ class PolicyDefinition(CollectorMixin):
         :param nodes: Node objects from TOSCA template
         :return: Policy object
         """
+        # policy type is needed for collecting targets and triggers so resolve it here only once
+        typ = self.type.resolve_reference(service_ast)
         # targets will be used also for collecting triggers so retrieve them here only once
-        targets = self.collect_targets(service_ast)
+        targets = self.collect_targets(service_ast, typ)
+        # targets and trigger target filters are matched by node name or type so index nodes here only once
+        node_index = self.index_nodes(nodes)
 
         policy = Policy(
             name=name,
             types=self.collect_types(service_ast),
             properties=self.collect_properties(service_ast),
-            targets=self.resolve_targets(targets, nodes),
-            triggers=self.collect_triggers(service_ast, targets, nodes)
+            targets=self.resolve_targets(targets, node_index),
+            triggers=self.collect_triggers(service_ast, typ, targets, nodes, node_index)
         )
 
         return policy
@@ -56,13 +60,13 @@ class PolicyDefinition(CollectorMixin):
         return {target.data: target for target in typ.get("targets", {})}
 
     # the next function is not part of the CollectorMixin because targets are policy only thing
-    def collect_targets(self, service_ast: Dict[str, Any]) -> Dict[str, Any]:
+    def collect_targets(self, service_ast: Dict[str, Any], typ: PolicyType) -> Dict[str, Any]:
         """
         Collect TOSCA policy targets
         :param service_ast: Abstract syntax tree dict
+        :param typ: Resolved PolicyType
         :return: Targets dict
         """
-        typ = self.type.resolve_reference(service_ast)
         definitions = self.collect_target_definitions(typ)
         assignments = {target.data: target for target in self.get("targets", {})}
 
@@ -79,21 +83,37 @@ class PolicyDefinition(CollectorMixin):
         }
 
     # the next function is not part of the CollectorMixin because targets are policy only thing
-    def resolve_targets(self, targets: Dict[str, Any], nodes: Dict[str, Node]) -> Dict[str, Any]:
+    def index_nodes(self, nodes: Dict[str, Node]) -> Dict[str, TypingList[Tuple[str, Node]]]:
+        """
+        Index TOSCA node objects by their name and by their type (used for matching policy targets and target filters)
+        :param nodes: Node objects from TOSCA template
+        :return: Dict with node name or type as key and list of matching (node name, node) tuples as value
+        """
+        # pylint: disable=no-self-use
+        node_index: Dict[str, TypingList[Tuple[str, Node]]] = {}
+        for node_name, node in nodes.items():
+            node_index.setdefault(node_name, []).append((node_name, node))
+            if node.types[0] != node_name:
+                node_index.setdefault(node.types[0], []).append((node_name, node))
+        return node_index
+
+    # the next function is not part of the CollectorMixin because targets are policy only thing
+    def resolve_targets(self, targets: Dict[str, Any],
+                        node_index: Dict[str, TypingList[Tuple[str, Node]]]) -> Dict[str, Any]:
         """
         Resolve TOSCA policy targets (link targets to their corresponding node objects)
         :param targets: Targets dict
-        :param nodes: Node objects from TOSCA template
+        :param node_index: Node objects from TOSCA template indexed by their name and type
         :return: Resolved targets dict
         """
+        # pylint: disable=no-self-use
         resolved_targets = {}
         if targets:
             for target_name in targets.keys():
-                for node_name, node in nodes.items():
-                    if node_name == target_name or node.types[0] == target_name:
-                        # assign node object when target name is the same as the name of node object/template or
-                        # when target name matches node object's type
-                        resolved_targets[node_name] = node
+                # assign node object when target name is the same as the name of node object/template or
+                # when target name matches node object's type
+                for node_name, node in node_index.get(target_name, []):
+                    resolved_targets[node_name] = node
         return resolved_targets
 
     # the next function is not part of the CollectorMixin because triggers are policy only thing
@@ -119,23 +139,21 @@ class PolicyDefinition(CollectorMixin):
         """
         collected_action = None
         actions_found = 0
+        interface_operation_name = str(call_operation_name)
         for _, target_node in targeted_nodes.items():
-            # loop through interfaces from targeted nodes
-            for interface_name, interface in target_node.interfaces.items():
-                # loop through interface operations from targeted nodes
-                for operation_name, operation in interface.operations.items():
-                    # find the corresponding node's interface operation
-                    if str(interface_name) + "." + str(operation_name) == str(call_operation_name):
-                        actions_found += 1
-
-                        # update the operation inputs with inputs from trigger's activity definition
-                        operation.inputs.update({
-                            k: [s.data for s in v.data]
-                            for k, v in action.get("inputs", {}).items()
-                        })
-
-                        collected_action = (interface_name, operation_name, operation)
-                        break
+            # find the corresponding node's interface operation
+            found_operation = target_node.find_operation(interface_operation_name)
+            if found_operation:
+                interface_name, operation_name, operation = found_operation
+                actions_found += 1
+
+                # update the operation inputs with inputs from trigger's activity definition
+                operation.inputs.update({
+                    k: [s.data for s in v.data]
+                    for k, v in action.get("inputs", {}).items()
+                })
+
+                collected_action = (interface_name, operation_name, operation)
 
         if actions_found == 0:
             self.abort(
@@ -155,11 +173,13 @@ class PolicyDefinition(CollectorMixin):
 
     # the next function is not part of the CollectorMixin because triggers are policy only thing
     def collect_trigger_target_nodes(self, target_filter: Optional[Tuple[str, Any]], nodes: Dict[str, Node],
+                                     node_index: Dict[str, TypingList[Tuple[str, Node]]],
                                      policy_targets: Dict[str, Any]) -> Dict[str, Node]:
         """
         Collect TOSCA policy trigger action from TOSCA interfaces
         :param target_filter: Target filter
         :param nodes: Node objects from TOSCA template
+        :param node_index: Node objects from TOSCA template indexed by their name and type
         :param policy_targets: Policy targets
         :return: Target Node objects from TOSCA template for trigger
         """
@@ -167,16 +187,17 @@ class PolicyDefinition(CollectorMixin):
         targeted_nodes = {}
         if target_filter:
             # if target node filter is applied collect just one targeted node from it
-            for node_name, node in nodes.items():
-                if node_name == target_filter[0] or node.types[0] == target_filter[0]:
-                    targeted_nodes[node_name] = node
-                    break
+            if target_filter[0] in node_index:
+                node_name, node = node_index[target_filter[0]][0]
+                targeted_nodes[node_name] = node
         elif policy_targets:
-            # if target_filter is not present collect target nodes from policy's targets
-            for node_name, node in nodes.items():
-                for policy_target_name, _ in policy_targets.items():
-                    if policy_target_name in (node_name, node.types[0]):
-                        targeted_nodes[node_name] = node
+            # if target_filter is not present collect target nodes from policy's targets (keep the template order)
+            targeted_node_names = {
+                node_name
+                for policy_target_name in policy_targets
+                for node_name, _ in node_index.get(policy_target_name, [])
+            }
+            targeted_nodes = {node_name: node for node_name, node in nodes.items() if node_name in targeted_node_names}
         else:
             # if we don't have any target node limits take all template's nodes into account
             targeted_nodes = nodes
@@ -186,17 +207,21 @@ class PolicyDefinition(CollectorMixin):
     # the next function is not part of the CollectorMixin because triggers are policy only thing
     def collect_trigger_actions(self, definition: Dict[str, Any],
                                 target_filter: Optional[Tuple[str, Any]], nodes: Dict[str, Node],
+                                node_index: Dict[str, TypingList[Tuple[str, Node]]],
                                 policy_targets: Dict[str, Any]) -> TypingList[Tuple[str, str, Operation]]:
         """
         Collect TOSCA policy trigger action from TOSCA interfaces
         :param definition: Trigger definition
         :param target_filter: Target filter
         :param nodes: Node objects from TOSCA template
+        :param node_index: Node objects from TOSCA template indexed by their name and type
         :param policy_targets: Policy targets
         :return: Trigger actions
         """
         actions = []
         action_definitions = definition.get("action", [])
+        # find Node objects that we are targeting with trigger actions (they are the same for all trigger's actions)
+        targeted_nodes = self.collect_trigger_target_nodes(target_filter, nodes, node_index, policy_targets)
         for action in action_definitions:
             # TODO: implement support for other types of trigger activity definitions.
             if list(action)[0] != "call_operation":
@@ -223,9 +248,6 @@ class PolicyDefinition(CollectorMixin):
                 if not call_operation_name:
                     self.abort("Missing required name for call_operation activity definition.", self.loc)
 
-                # find Node objects that we are targeting with trigger action
-                targeted_nodes = self.collect_trigger_target_nodes(target_filter, nodes, policy_targets)
-
                 # collect actions (interface operations) from targeted nodes
                 collected_action = self.collect_trigger_action_from_interfaces(targeted_nodes, call_operation_name,
                                                                                action)
@@ -236,42 +258,39 @@ class PolicyDefinition(CollectorMixin):
 
     # the next function is not part of the CollectorMixin because target_filter is policy only thing
     def resolve_event_filter(self, target_filter: Optional[Tuple[str, Any]],
-                             nodes: Dict[str, Node]) -> Optional[Tuple[str, Any]]:
+                             node_index: Dict[str, TypingList[Tuple[str, Node]]]) -> Optional[Tuple[str, Any]]:
         """
         Resolve TOSCA policy trigger target filter (link trigger's target filter to targeted node object)
         :param target_filter: Target filter
-        :param nodes: Node objects from TOSCA template
+        :param node_index: Node objects from TOSCA template indexed by their name and type
         :return: Resolved target filter
         """
+        # pylint: disable=no-self-use
         resolved_target_filter = None
-        if target_filter:
-            for node_name, node in nodes.items():
-                if node_name == target_filter[0] or node.types[0] == target_filter[0]:
-                    resolved_target_filter = node_name, node
-                    break
+        if target_filter and target_filter[0] in node_index:
+            resolved_target_filter = node_index[target_filter[0]][0]
 
         return resolved_target_filter
 
     # the next function is not part of the CollectorMixin because triggers are policy only thing
-    def collect_triggers(self, service_ast: Dict[str, Any], policy_targets: Dict[str, Any],
-                         nodes: Dict[str, Node]) -> Dict[str, Trigger]:
+    def collect_triggers(self, service_ast: Dict[str, Any], typ: PolicyType, policy_targets: Dict[str, Any],
+                         nodes: Dict[str, Node],
+                         node_index: Dict[str, TypingList[Tuple[str, Node]]]) -> Dict[str, Trigger]:
         """
         Collect TOSCA policy triggers
         :param service_ast: Abstract syntax tree dict
+        :param typ: Resolved PolicyType
         :param policy_targets: TOSCA policy targets
         :param nodes: Node objects from TOSCA template
+        :param node_index: Node objects from TOSCA template indexed by their name and type
         :return: Triggers dict
         """
         # pylint: disable=too-many-locals
-        typ = self.type.resolve_reference(service_ast)
         definitions = self.collect_trigger_definitions(typ, service_ast)
         assignments = self.get("triggers", {})
 
-        duplicate_triggers = set(assignments.keys()).intersection(definitions.keys())
-        if duplicate_triggers:
-            for duplicate in duplicate_triggers:
-                definitions.pop(duplicate)
-
+        # triggers from policy template override (and are ordered after) the triggers from policy type
+        definitions = {name: definition for name, definition in definitions.items() if name not in assignments}
         definitions.update(assignments)
 
         # TODO: Optimize this code which is now nasty with a lot of parsing, looping and everything else.
@@ -296,11 +315,11 @@ class PolicyDefinition(CollectorMixin):
                 )
 
             # collect action definitions
-            actions = self.collect_trigger_actions(definition, target_filter, nodes, policy_targets)
+            actions = self.collect_trigger_actions(definition, target_filter, nodes, node_index, policy_targets)
 
             trigger = Trigger(name=name,
                               event=definition.get("event", None),
-                              target_filter=self.resolve_event_filter(target_filter, nodes),
+                              target_filter=self.resolve_event_filter(target_filter, node_index),
                               condition=definition.get("condition", None),
                               action=actions)
 
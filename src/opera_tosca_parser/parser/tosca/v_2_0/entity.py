@@ -84,6 +84,9 @@ class Entity(MapWrapper):
 class TypeEntity(Entity):
     REFERENCE: Optional[Reference] = None  # Override in subclasses
 
+    # This is set for each derived class when its attributes are retrieved for the first time
+    _merged_attrs: Optional[dict] = None
+
     @classmethod
     def normalize(cls, yaml_node: Node) -> Node:
         """
@@ -120,17 +123,21 @@ class TypeEntity(Entity):
     @classmethod
     def attrs(cls) -> dict:
         """
-        Retrieve attributes
+        Retrieve attributes (merged with common type attributes only once per class)
         :return: Dict of attributes
         """
-        if not isinstance(cls.REFERENCE, Reference):
-            raise AssertionError(f"Override REFERENCE in {cls.__name__} with Reference.")
-
-        attributes = cls.ATTRS.copy()
-        attributes.update(
-            derived_from=cls.REFERENCE,
-            description=String,
-            metadata=Map(String),
-            version=Version,
-        )
+        # check the class dict directly because merged attributes must not be inherited from the parent class
+        attributes = cls.__dict__.get("_merged_attrs")
+        if attributes is None:
+            if not isinstance(cls.REFERENCE, Reference):
+                raise AssertionError(f"Override REFERENCE in {cls.__name__} with Reference.")
+
+            attributes = cls.ATTRS.copy()
+            attributes.update(
+                derived_from=cls.REFERENCE,
+                description=String,
+                metadata=Map(String),
+                version=Version,
+            )
+            cls._merged_attrs = attributes
         return attributes
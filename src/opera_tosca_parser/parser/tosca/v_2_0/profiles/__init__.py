@@ -1,3 +1,5 @@
+import functools
+
 import pkg_resources
 
 from opera_tosca_parser.error import ParseError
@@ -31,6 +33,17 @@ def load(name: str, input_yaml: Node) -> yaml.node.Node:
         raise ParseError(f"Unsupported TOSCA profile. Available: {', '.join(SUPPORTED_TOSCA_PROFILES.values())}.",
                          input_yaml.loc)
 
+    return _load_profile(name)
+
+
+# parsed YAML nodes are never modified, so each well-known TOSCA profile is read and parsed only once
+@functools.lru_cache(maxsize=8)
+def _load_profile(name: str) -> yaml.node.Node:
+    """
+    Load supported TOSCA profile from the profile file
+    :param name: Well known TOSCA profile name (e.g., 'org.oasis-open.tosca.simple:2.0')
+    :return: YAML node
+    """
     folder_name = [k for k, v in SUPPORTED_TOSCA_PROFILES.items() if v == name][0]
 
     # TODO: Rethink if it's okay for profile.yaml to be fixed.
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from opera_tosca_parser.parser.tosca.v_2_0.template.policy import Policy
     from opera_tosca_parser.parser.tosca.v_2_0.template.capability import Capability
     from opera_tosca_parser.parser.tosca.v_2_0.template.interface import Interface
+    from opera_tosca_parser.parser.tosca.v_2_0.template.operation import Operation
     from opera_tosca_parser.parser.tosca.v_2_0.template.requirement import Requirement
     from opera_tosca_parser.parser.tosca.v_2_0.value import Value
 
@@ -44,6 +45,8 @@ class Node:
         self.topology: Optional[Topology] = None
         # This will be set at instantiation time.
         self._instance = None  # type: ignore
+        # This will be set when the interface operations are looked up for the first time.
+        self._operation_index: Optional[Dict[str, Tuple[str, str, Operation]]] = None
 
     def resolve_requirements(self, topology: Topology):
         """
@@ -73,6 +76,20 @@ class Node:
         """
         return typ in self.types
 
+    def find_operation(self, interface_operation_name: str) -> Optional[Tuple[str, str, Operation]]:
+        """
+        Find node interface operation by its full name
+        :param interface_operation_name: Interface operation name (as <interface_name>.<operation_name>)
+        :return: Tuple with interface name, operation name and Operation object or None if operation is not found
+        """
+        if self._operation_index is None:
+            self._operation_index = {
+                str(interface_name) + "." + str(operation_name): (interface_name, operation_name, operation)
+                for interface_name, interface in self.interfaces.items()
+                for operation_name, operation in interface.operations.items()
+            }
+        return self._operation_index.get(interface_operation_name)
+
     @property
     def instance(self) -> Any:
         """
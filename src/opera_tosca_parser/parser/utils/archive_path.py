@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import io
+import zipfile
+from pathlib import PurePath
+from typing import IO, Union
+
+
+class ZipArchivePath:
+    """Read-only pathlib.Path-like object for members of zip archives (used to parse compressed TOSCA CSARs)"""
+
+    def __init__(self, archive: Union[zipfile.ZipFile, zipfile.Path], at: str = ""):
+        """
+        Construct ZipArchivePath object
+        :param archive: Opened zip archive (or zipfile.Path object pointing to the archive member)
+        :param at: Path to archive member relative to the root of the archive
+        """
+        if isinstance(archive, zipfile.Path):
+            self._path = archive
+        else:
+            self._path = zipfile.Path(archive, at)
+
+    def __truediv__(self, other: Union[str, PurePath]) -> ZipArchivePath:
+        """
+        Join archive path with relative path
+        :param other: Relative path
+        :return: ZipArchivePath object
+        """
+        return ZipArchivePath(self._path / PurePath(other).as_posix())
+
+    def __str__(self) -> str:
+        """Overridden string representation"""
+        return str(self._path)
+
+    def open(self) -> IO[str]:
+        """
+        Open archive member file for reading
+        :return: Opened text stream
+        """
+        return io.TextIOWrapper(self._path.root.open(self._path.at), encoding="utf-8")
+
+    def exists(self) -> bool:
+        """
+        Check whether archive member exists
+        :return: True if exists else False
+        """
+        return self._path.exists()
+
+    def is_dir(self) -> bool:
+        """
+        Check whether archive member is a directory
+        :return: True if is a directory else False
+        """
+        return self._path.is_dir()
+
+    def is_file(self) -> bool:
+        """
+        Check whether archive member is a file
+        :return: True if is a file else False
+        """
+        return self._path.is_file()
+
+    def is_symlink(self) -> bool:  # pylint: disable=no-self-use
+        """
+        Check whether archive member is a symlink (symlinks are not preserved when zip archives are extracted)
+        :return: Always False
+        """
+        return False
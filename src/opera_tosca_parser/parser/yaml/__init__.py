@@ -1,7 +1,9 @@
 from typing import Any
 
+import yaml as pyyaml
+
 from opera_tosca_parser.parser.yaml.node import Node
-from .loader import Loader
+from .loader import Loader, SafeLoader
 
 
 def load(stream: Any, stream_path: str) -> Node:
@@ -16,3 +18,12 @@ def load(stream: Any, stream_path: str) -> Node:
         return ldr.get_single_data()
     finally:
         ldr.dispose()
+
+
+def safe_load(stream: Any) -> Any:
+    """
+    Safe loader function for plain YAML documents
+    :param stream: IO Stream or string
+    :return: Python object
+    """
+    return pyyaml.load(stream, Loader=SafeLoader)
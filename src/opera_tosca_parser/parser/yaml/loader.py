@@ -1,5 +1,7 @@
 from typing import Any
 
+import yaml
+
 from .constructor import Constructor
 from .resolver import Resolver
 
@@ -46,3 +48,7 @@ except ImportError:
             Composer.__init__(self)
             Constructor.__init__(self, stream_name)
             Resolver.__init__(self)
+
+
+# plain PyYAML safe loader (without TOSCA locations) that uses libyaml bindings when they are available
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
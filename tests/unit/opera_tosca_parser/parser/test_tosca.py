@@ -217,6 +217,86 @@ class TestLoad:
         with pytest.raises(ParseError):
             tosca.load_service_template(tmp_path, name)
 
+    def test_cached_until_imported_template_changes(self, tmp_path, yaml_text):
+        name = pathlib.PurePath("template.yaml")
+        (tmp_path / name).write_text(yaml_text(
+            # language=yaml
+            """
+            tosca_definitions_version: tosca_simple_yaml_1_3
+            imports:
+              - imp.yaml
+            """
+        ))
+        (tmp_path / "imp.yaml").write_text(yaml_text(
+            # language=yaml
+            """
+            tosca_definitions_version: tosca_simple_yaml_1_3
+            data_types:
+              my_type:
+                derived_from: tosca.datatypes.xml
+            """
+        ))
+
+        doc = tosca.load_service_template(tmp_path, name)
+        assert tosca.load_service_template(tmp_path, name) is doc
+
+        (tmp_path / "imp.yaml").write_text(yaml_text(
+            # language=yaml
+            """
+            tosca_definitions_version: tosca_simple_yaml_1_3
+            data_types:
+              my_other_type:
+                derived_from: tosca.datatypes.xml
+            """
+        ))
+
+        doc = tosca.load_service_template(tmp_path, name)
+        assert "my_type" not in doc.data_types
+        assert doc.data_types["my_other_type"]
+
+    def test_cached_template_paths_are_validated(self, tmp_path, yaml_text):
+        name = pathlib.PurePath("template.yaml")
+        (tmp_path / name).write_text(yaml_text(
+            # language=yaml
+            """
+            tosca_definitions_version: tosca_simple_yaml_1_3
+            topology_template:
+              node_templates:
+                my_node:
+                  type: tosca.nodes.SoftwareComponent
+                  interfaces:
+                    Standard:
+                      operations:
+                        create: create.yaml
+            """
+        ))
+        (tmp_path / "create.yaml").write_text("---\n")
+
+        tosca.load_service_template(tmp_path, name)
+        (tmp_path / "create.yaml").unlink()
+        with pytest.raises(ParseError):
+            tosca.load_service_template(tmp_path, name)
+
+    def test_shared_stdlib_is_not_modified(self, tmp_path, yaml_text):
+        (tmp_path / "first").mkdir()
+        (tmp_path / "first" / "template.yaml").write_text(yaml_text(
+            # language=yaml
+            """
+            tosca_definitions_version: tosca_simple_yaml_1_3
+            data_types:
+              my_type:
+                derived_from: tosca.datatypes.xml
+            """
+        ))
+        (tmp_path / "second").mkdir()
+        (tmp_path / "second" / "template.yaml").write_text("tosca_definitions_version: tosca_simple_yaml_1_3")
+
+        first = tosca.load_service_template(tmp_path / "first", pathlib.PurePath("template.yaml"))
+        second = tosca.load_service_template(tmp_path / "second", pathlib.PurePath("template.yaml"))
+        assert "my_type" in first.data_types.data
+        assert "my_type" not in second.data_types.data
+        assert "tosca.datatypes.xml" in second.data_types.data
+
 
 class TestExecute:
     def test_undefined_required_properties1(self, tmp_path, yaml_text):
@@ -138,6 +138,10 @@ class Baddie(TypeEntity):
     ATTRS = dict(dummy=Base)
 
 
+class GoodieChild(Goodie):
+    ATTRS = dict(other_dummy=Base)
+
+
 class TestTypeEntityValidate:
     def test_valid_data(self, yaml_ast):
         Goodie.validate(yaml_ast(
@@ -160,3 +164,9 @@ class TestTypeEntityAttrs:
     def test_reference_class_check(self):
         with pytest.raises(AssertionError):
             Baddie.attrs()
+
+    def test_merged_once_per_class(self):
+        assert Goodie.attrs() is Goodie.attrs()
+        assert set(GoodieChild.attrs().keys()) == {
+            "derived_from", "description", "metadata", "version", "other_dummy"
+        }
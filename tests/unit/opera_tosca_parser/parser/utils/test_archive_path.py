@@ -0,0 +1,37 @@
+import pathlib
+import zipfile
+
+import pytest
+
+from opera_tosca_parser.parser import tosca
+from opera_tosca_parser.parser.utils.archive_path import ZipArchivePath
+
+
+@pytest.fixture
+def archive(tmp_path):
+    with zipfile.ZipFile(tmp_path / "test.csar", mode="w") as zf:
+        zf.writestr("service.yaml", "tosca_definitions_version: tosca_simple_yaml_1_3\nimports: [ sub/imp.yaml ]\n")
+        zf.writestr("sub/imp.yaml", "tosca_definitions_version: tosca_simple_yaml_1_3\n")
+
+    with zipfile.ZipFile(tmp_path / "test.csar", mode="r") as zf:
+        yield zf
+
+
+class TestZipArchivePath:
+    def test_members(self, archive):
+        root = ZipArchivePath(archive)
+
+        assert (root / "service.yaml").is_file()
+        assert not (root / "service.yaml").is_dir()
+        assert (root / pathlib.PurePath("sub")).is_dir()
+        assert (root / "sub" / "imp.yaml").exists()
+        assert not (root / "missing.yaml").exists()
+        assert not (root / "service.yaml").is_symlink()
+
+    def test_open(self, archive):
+        with (ZipArchivePath(archive) / "sub/imp.yaml").open() as fd:
+            assert fd.read() == "tosca_definitions_version: tosca_simple_yaml_1_3\n"
+
+    def test_load_service_template(self, archive):
+        doc = tosca.load_service_template(ZipArchivePath(archive), pathlib.PurePath("service.yaml"))
+        assert doc.tosca_definitions_version.data == "tosca_simple_yaml_1_3"
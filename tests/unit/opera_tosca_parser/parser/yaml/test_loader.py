@@ -59,3 +59,9 @@ class TestLoad:
     @pytest.mark.parametrize("input_string,output", VALID_TEST_CASES)
     def test_load_valid_yaml(self, input_string, output):
         assert yaml.load(input_string, "test").bare == output
+
+
+class TestSafeLoad:
+    @pytest.mark.parametrize("input_string,output", VALID_TEST_CASES)
+    def test_safe_load_valid_yaml(self, input_string, output):
+        assert yaml.safe_load(input_string) == output